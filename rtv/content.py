@@ -22,6 +22,14 @@ _logger = logging.getLogger(__name__)
 
 class Content(object):
 
+    # Wrapped lines keyed by (text, type, width). The same titles and comment
+    # bodies are re-wrapped every time the page is drawn, and measuring the
+    # unicode width of each character is the most expensive part of the draw.
+    # The type is part of the key because py2 considers equal unicode and
+    # byte strings the same key.
+    _wrap_cache = {}
+    _wrap_cache_size = 1024
+
     def get(self, index, n_cols):
         """
         Grab the item at the given index, and format the text to fit a width of
@@ -397,20 +405,27 @@ class Content(object):
         else:
             return '%dyr' % years
 
-    @staticmethod
-    def wrap_text(text, width):
+    @classmethod
+    def wrap_text(cls, text, width):
         """
         Wrap text paragraphs to the given character width while preserving
         newlines.
         """
-        out = []
-        for paragraph in text.splitlines():
-            # Wrap returns an empty list when paragraph is a newline. In order
-            # to preserve newlines we substitute a list containing an empty
-            # string.
-            lines = wrap(paragraph, width=width) or ['']
-            out.extend(lines)
-        return out
+        key = (text, type(text), width)
+        out = cls._wrap_cache.get(key)
+        if out is None:
+            out = []
+            for paragraph in text.splitlines():
+                # Wrap returns an empty list when paragraph is a newline. In
+                # order to preserve newlines we substitute a list containing an
+                # empty string.
+                lines = wrap(paragraph, width=width) or ['']
+                out.extend(lines)
+            if len(cls._wrap_cache) >= cls._wrap_cache_size:
+                cls._wrap_cache.clear()
+            cls._wrap_cache[key] = out
+        # Return a copy so the caller can't modify the cached lines
+        return list(out)
 
     @staticmethod
     def extract_links(html):
@@ -114,6 +114,11 @@ def curses_session():
             curses.curs_set(0)
         except:
             _logger.warning('Curses failed to initialize the cursor mode')
+        else:
+            # The cursor is hidden while browsing, so don't make curses move
+            # it back into place after every screen update. Text input is
+            # done in separate windows that still track the cursor position.
+            stdscr.leaveok(1)
 
         yield stdscr
 
@@ -359,8 +364,15 @@ class Navigator(object):
         self._page_cb = valid_page_cb
 
     @property
-    def step(self):
-        return 1 if not self.inverted else -1
+    def inverted(self):
+        return self._inverted
+
+    @inverted.setter
+    def inverted(self, inverted):
+        # The step is read on every cursor move and while laying out the
+        # page, so keep it as a plain attribute that follows the orientation
+        self._inverted = inverted
+        self.step = 1 if not inverted else -1
 
     @property
     def position(self):
@@ -477,19 +489,28 @@ class Navigator(object):
                     self.cursor_index \
                         = (n_windows - (direction < 0)) - self.cursor_index
 
-                valid = False
-                adj = 0
                 # check if reached the bottom
-                while not valid:
-                    n_move = n_windows - adj
-                    if n_move == 0:
-                        break
-
-                    self.page_index += n_move * direction
-                    valid = self._is_valid(self.absolute_index)
-                    if not valid:
+                self.page_index += n_windows * direction
+                valid = self._is_valid(self.absolute_index)
+                if not valid:
+                    self.page_index -= n_windows * direction
+                    # The valid items are contiguous, so search for the
+                    # furthest move that stays in bounds instead of trying
+                    # one item at a time. `lo` is always valid (or no move)
+                    # and `hi` is always out of bounds.
+                    lo, hi = 0, n_windows
+                    while hi - lo > 1:
+                        n_move = (lo + hi) // 2
+                        self.page_index += n_move * direction
+                        if self._is_valid(self.absolute_index):
+                            lo = n_move
+                        else:
+                            hi = n_move
                         self.page_index -= n_move * direction
-                        adj += 1
+
+                    if lo > 0:
+                        self.page_index += lo * direction
+                        valid = True
 
             redraw = True
 
@@ -551,6 +572,7 @@ class Controller(object):
         self.last_char = None
 
         if not keymap:
+            self._bindings = self._build_bindings()
             return
 
         # Go through the controller and all of it's parents and look for
@@ -583,21 +605,38 @@ class Controller(object):
                                 "%s" % (key, controller.__name__))
                         controller.character_map[val] = func
 
+        self._bindings = self._build_bindings()
+
+    def _build_bindings(self):
+        """
+        Flatten the character maps into a single lookup table so that a
+        keypress doesn't need to walk every parent controller. Each entry
+        remembers how far down the MRO it was found, the closest wins.
+        Keys that are marked with None (the first half of a double key press)
+        fall through to the parents, the same as a missing key.
+        """
+        bindings = {}
+        for depth, controller in enumerate(self.parents):
+            for key, func in controller.character_map.items():
+                if func and not isinstance(key, Command):
+                    bindings.setdefault(key, (depth, func))
+        return bindings
+
     def trigger(self, char, *args, **kwargs):
 
         if isinstance(char, six.string_types) and len(char) == 1:
             char = ord(char)
 
-        func = None
         # Check if the controller (or any of the controller's parents) have
-        # registered a function to the given key
-        for controller in self.parents:
-            func = controller.character_map.get((self.last_char, char))
-            if func:
-                break
-            func = controller.character_map.get(char)
-            if func:
-                break
+        # registered a function to the given key. A double key press beats a
+        # single key that was registered on the same controller.
+        func = None
+        double = self._bindings.get((self.last_char, char))
+        single = self._bindings.get(char)
+        if double and (single is None or double[0] <= single[0]):
+            func = double[1]
+        elif single:
+            func = single[1]
 
         if func:
             self.last_char = None
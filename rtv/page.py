@@ -5,6 +5,7 @@ import re
 import os
 import sys
 import time
+import curses
 import logging
 from functools import wraps
 
@@ -19,6 +20,21 @@ from .__version__ import __version__
 
 _logger = logging.getLogger(__name__)
 
+# The docs are constants, so only prepare them for display once
+_HELP_TEXT = docs.HELP.strip()
+_TIME_ORDER_LINES = docs.TIME_ORDER_MENU.strip().splitlines()
+
+# Header titles for the different listings on a user's page
+_USER_ROOM_TITLES = {
+    'overview': 'Overview',
+    'submitted': 'Submissions',
+    'comments': 'Comments',
+    'saved': 'Saved Content',
+    'hidden': 'Hidden Content',
+    'upvoted': 'Upvoted Content',
+    'downvoted': 'Downvoted Content'
+}
+
 
 def logged_in(f):
     """
@@ -43,6 +59,22 @@ class Page(object):
     BANNER = None
     FOOTER = None
 
+    # Maps the keys in the time period menu to the suffix for the sort order
+    _PERIOD_SUFFIXES = {
+        ord('\n'): '',
+        ord('1'): '-hour',
+        ord('2'): '-day',
+        ord('3'): '-week',
+        ord('4'): '-month',
+        ord('5'): '-year',
+        ord('6'): '-all'}
+
+    # The words in each banner and their total length, shared between pages
+    _banner_items = {}
+
+    # Matches submission urls entered in the prompt, e.g. /r/pics/comments/571dw3/
+    _SUBMISSION_PATTERN = re.compile(r'(^|/)comments/(?P<id>[^/]+)')
+
     def __init__(self, reddit, term, config, oauth):
         self.reddit = reddit
         self.term = term
@@ -57,6 +89,36 @@ class Page(object):
         self._row = 0
         self._subwindows = None
 
+        # Setting the terminal title will break emacs or systems without
+        # X window.
+        self._set_title = bool(os.getenv('DISPLAY')) and not os.getenv('INSIDE_EMACS')
+        self._last_title = None
+        self._display_name_cache = (None, None)
+        self._banner_cache = {}
+        self._attrs = {}
+        self._attrs_theme = None
+
+        # The starting position of the username depends on if we're converting
+        # to ascii or not
+        self._width_fn = len if self.config['ascii'] else textual_width
+        self._width_cache = {}
+
+        # Windows for the header, banner, content, and footer are re-used
+        # between redraws until the size of the terminal changes. The same
+        # goes for the item subwindows, as long as the layout is unchanged.
+        self._windows = {}
+        self._windows_size = None
+        self._subwindow_cache = {}
+        self._subwindow_parent = None
+        self._header_sig = None
+        self._footer_sig = None
+
+        # Set by _move_cursor() to track if the last key actually moved the
+        # cursor, or if it was stopped at the end of the page. If the cursor
+        # moved without scrolling the page, keep track of where it came from.
+        self._cursor_moved = None
+        self._cursor_prev = None
+
     def refresh_content(self, order=None, name=None):
         raise NotImplementedError
 
@@ -81,20 +143,33 @@ class Page(object):
         the methods.
         """
         self.active = True
-
-        # This needs to be called once before the main loop, in case a subpage
-        # was pre-selected before the loop started. This happens in __main__.py
-        # with ``page.open_submission(url=url)``
-        while self.selected_page and self.active:
-            self.handle_selected_page()
-
+        redraw = True
         while self.active:
-            self.draw()
+            # Nested pages are handled before the next draw. This also covers
+            # a subpage that was pre-selected before the loop started, which
+            # happens in __main__.py with ``page.open_submission(url=url)``
+            if self.selected_page:
+                self.handle_selected_page()
+                # A nested page may have overwritten the terminal title and
+                # the header and footer lines
+                self._last_title = None
+                self._header_sig = None
+                self._footer_sig = None
+                redraw = True
+                continue
+
+            if redraw:
+                self.draw()
             ch = self.term.stdscr.getch()
+            self._cursor_moved = None
+            self._cursor_prev = None
             self.controller.trigger(ch)
-
-            while self.selected_page and self.active:
-                self.handle_selected_page()
+            # Trying to move the cursor past the end of the page doesn't
+            # change anything, so there's no need to redraw the screen
+            redraw = self._cursor_moved is not False
+            if redraw and self._cursor_prev is not None:
+                self._draw_cursor(self._cursor_prev)
+                redraw = False
 
         return self.selected_page
 
@@ -188,7 +263,7 @@ class Page(object):
         """
         Open the help documentation in the system pager.
         """
-        self.term.open_pager(docs.HELP.strip())
+        self.term.open_pager(_HELP_TEXT)
 
     @PageController.register(Command('MOVE_UP'))
     def move_cursor_up(self):
@@ -249,7 +324,7 @@ class Page(object):
         data = self.get_selected_item()
         if 'likes' not in data:
             self.term.flash()
-        elif getattr(data['object'], 'archived'):
+        elif data['object'].archived:
             self.term.show_notification("Voting disabled for archived post", style='Error')
         elif data['likes']:
             with self.term.loader('Clearing vote'):
@@ -271,7 +346,7 @@ class Page(object):
         data = self.get_selected_item()
         if 'likes' not in data:
             self.term.flash()
-        elif getattr(data['object'], 'archived'):
+        elif data['object'].archived:
             self.term.show_notification("Voting disabled for archived post", style='Error')
         elif data['likes'] or data['likes'] is None:
             with self.term.loader('Voting'):
@@ -348,8 +423,7 @@ class Page(object):
 
         # Construct the text that will be displayed in the editor file.
         # The post body will be commented out and added for reference
-        lines = ['  |' + line for line in body.split('\n')]
-        content = '\n'.join(lines)
+        content = '  |' + body.replace('\n', '\n  |')
         comment_info = docs.REPLY_FILE.format(
             author=data['author'],
             type=description,
@@ -574,9 +648,7 @@ class Page(object):
             #     /comments/571dw3
             #     /r/pics/comments/571dw3/
             #     https://www.reddit.com/r/pics/comments/571dw3/at_disneyland
-            submission_pattern = re.compile(r'(^|/)comments/(?P<id>.+?)($|/)')
-
-            match = submission_pattern.search(name)
+            match = self._SUBMISSION_PATTERN.search(name)
             if match:
                 url = 'https://www.reddit.com/comments/{0}'.format(match.group('id'))
                 self.selected_page = self.open_submission_page(url)
@@ -643,9 +715,9 @@ class Page(object):
         """
         Clear excessive input caused by the scroll wheel or holding down a key
         """
-        with self.term.no_delay():
-            while self.term.getch() != -1:
-                continue
+        # Discards everything in the typeahead buffer in one call, instead of
+        # toggling nodelay and reading the pending keys one at a time
+        curses.flushinp()
 
     def draw(self):
         """
@@ -657,68 +729,117 @@ class Page(object):
             # small at startup because self._subwindows will never be populated
             return
 
+        if self.term.theme is not self._attrs_theme:
+            self._refresh_attrs()
+
         self._row = 0
-        self._draw_header()
-        self._draw_banner()
-        self._draw_content()
-        self._draw_footer()
-        self.term.clear_screen()
-        self.term.stdscr.refresh()
+        self._draw_header(n_rows, n_cols)
+        self._draw_banner(n_rows, n_cols)
+        self._draw_content(n_rows, n_cols)
+        self._draw_footer(n_rows, n_cols)
+        self._update_screen()
 
-    def _draw_header(self):
+    def _draw_cursor(self, prev_index):
         """
-        Draw the title bar at the top of the screen
+        Redraw only the items that the cursor moved between. The rest of the
+        page looks the same, so the subwindows from the last draw are re-used.
         """
         n_rows, n_cols = self.term.stdscr.getmaxyx()
+        if (n_rows, n_cols) != self._windows_size:
+            self.draw()
+            return
 
-        # Note: 2 argument form of derwin breaks PDcurses on Windows 7!
-        window = self.term.stdscr.derwin(1, n_cols, self._row, 0)
-        window.erase()
-        # curses.bkgd expects bytes in py2 and unicode in py3
-        window.bkgd(str(' '), self.term.attr('TitleBar'))
+        if self.nav.absolute_index >= 0:
+            selected_index = self.nav.cursor_index
+        else:
+            selected_index = None
+        for index in (prev_index, self.nav.cursor_index):
+            win, _, inverted = self._subwindows[index]
+            # Checking the bounds of the move formats items with the default
+            # width, so grab the data again at the width of the page
+            page_index = self.nav.page_index + self.nav.step * index
+            data = self.content.get(page_index, n_cols=n_cols - 2)
+            win.erase()
+            if index == selected_index:
+                win.bkgd(str(' '), self._attrs['Selected'])
+                with self.term.theme.turn_on_selected():
+                    self._draw_item(win, data, inverted)
+            else:
+                win.bkgd(str(' '), self._attrs['Normal'])
+                self._draw_item(win, data, inverted)
+        self._update_screen()
 
-        sub_name = self.content.name
-        sub_name = sub_name.replace('/r/front', 'Front Page')
+    def _update_screen(self):
+        """
+        Push the drawn page to the terminal.
+        """
+        # This is not redundant. Popups like the notification window and the
+        # loader are drawn with newwin() on top of stdscr, so the whole screen
+        # needs to be touched for curses to paint over them. See the
+        # docstring on clear_screen() for why clearok() is used in some cases.
+        self.term.clear_screen()
+        # The header, banner, content, and footer are all derived from stdscr,
+        # so stage the whole screen and push it to the terminal in one update
+        self.term.stdscr.noutrefresh()
+        curses.doupdate()
 
-        parts = sub_name.split('/')
-        if len(parts) == 1:
-            pass
-        elif '/m/' in sub_name:
-            _, _, user, _, multi = parts
-            sub_name = '{} Curated by {}'.format(multi, user)
-        elif parts[1] == 'u':
-            noun = 'My' if parts[2] == 'me' else parts[2] + "'s"
-            user_room = parts[3] if len(parts) == 4 else 'overview'
-            title_lookup = {
-                'overview': 'Overview',
-                'submitted': 'Submissions',
-                'comments': 'Comments',
-                'saved': 'Saved Content',
-                'hidden': 'Hidden Content',
-                'upvoted': 'Upvoted Content',
-                'downvoted': 'Downvoted Content'
-            }
-            sub_name = "{} {}".format(noun, title_lookup[user_room])
+    def _refresh_attrs(self):
+        """
+        Look up the theme attributes used when drawing the page. These are
+        cached and only need to be looked up again when the theme changes.
+        """
+        self._attrs = {}
+        for element in ('TitleBar', 'OrderBar', 'OrderBarHighlight',
+                        'Selected', 'Normal', 'HelpBar'):
+            self._attrs[element] = self.term.attr(element)
+        self._attrs_theme = self.term.theme
+
+    def _get_window(self, name, n_lines, n_rows, n_cols):
+        """
+        Return a full width window for the header, banner, content, or footer
+        starting at the current row. The windows are cached so that a new
+        derwin doesn't need to be allocated on every redraw, and are thrown
+        away when the terminal is resized.
+        """
+        if (n_rows, n_cols) != self._windows_size:
+            self._windows = {}
+            self._windows_size = (n_rows, n_cols)
+
+        key = (name, n_lines, self._row)
+        window = self._windows.get(key)
+        if window is None:
+            # Note: 2 argument form of derwin breaks PDcurses on Windows 7!
+            window = self.term.stdscr.derwin(n_lines, n_cols, self._row, 0)
+            self._windows[key] = window
+        return window
+
+    def _draw_header(self, n_rows, n_cols):
+        """
+        Draw the title bar at the top of the screen
+        """
+        # The display name only needs to be re-computed when the content
+        # changes, not on every redraw
+        name = self.content.name
+        if name != self._display_name_cache[0]:
+            self._display_name_cache = (name, self._get_display_name(name))
+        sub_name = self._display_name_cache[1]
 
         query = self.content.query
         if query:
             sub_name = 'Searching {0}: {1}'.format(sub_name, query)
-        self.term.add_line(window, sub_name, 0, 0)
 
-        # Set the terminal title
-        if len(sub_name) > 50:
-            title = sub_name.strip('/')
-            title = title.replace('_', ' ')
-            try:
-                title = title.rsplit('/', 1)[1]
-            except IndexError:
-                pass
-        else:
-            title = sub_name
+        # Set the terminal title, skipping the write + flush to stdout if the
+        # title hasn't changed since the last draw. External programs like the
+        # editor or the pager may have overwritten it in the meantime.
+        title_key = (sub_name, self.config['ascii'], self.term.suspend_count)
+        if self._set_title and title_key != self._last_title:
+            if len(sub_name) > 50:
+                title = sub_name.strip('/')
+                title = title.replace('_', ' ')
+                title = title.rpartition('/')[2]
+            else:
+                title = sub_name
 
-        # Setting the terminal title will break emacs or systems without
-        # X window.
-        if os.getenv('DISPLAY') and not os.getenv('INSIDE_EMACS'):
             title += ' - rtv {0}'.format(__version__)
             title = self.term.clean(title)
             if six.PY3:
@@ -729,57 +850,192 @@ class Page(object):
                 title = b'\x1b]2;{0}\x07'.format(title)
             sys.stdout.write(title)
             sys.stdout.flush()
+            self._last_title = title_key
 
         if self.reddit and self.reddit.user is not None:
-            # The starting position of the name depends on if we're converting
-            # to ascii or not
-            width = len if self.config['ascii'] else textual_width
-
             if self.config['hide_username']:
                 username = "Logged in"
             else:
                 username = self.reddit.user.name
-            s_col = (n_cols - width(username) - 1)
+        else:
+            username = None
+
+        # The header line is left untouched in the screen buffer between
+        # draws, so it only needs to be repainted when something changes
+        sig = (sub_name, username, n_rows, n_cols, self._row, self._attrs_theme)
+        if sig == self._header_sig:
+            self._row += 1
+            return
+        self._header_sig = sig
+
+        window = self._get_window('header', 1, n_rows, n_cols)
+        # Set the background before erasing so that the blank fill picks up
+        # the attribute in a single pass. curses.bkgdset expects bytes in py2
+        # and unicode in py3
+        window.bkgdset(str(' '), self._attrs['TitleBar'])
+        window.erase()
+        self.term.add_line(window, sub_name, 0, 0)
+
+        if username is not None:
+            # The starting position of the name depends on if we're converting
+            # to ascii or not
+            s_col = (n_cols - self._get_width(username) - 1)
             # Only print username if it fits in the empty space on the right
-            if (s_col - 1) >= width(sub_name):
+            if (s_col - 1) >= self._get_width(sub_name):
                 self.term.add_line(window, username, 0, s_col)
 
         self._row += 1
 
-    def _draw_banner(self):
+    def _get_width(self, text):
+        """
+        Return the printed width of a string, memoized because the same
+        names are measured on every redraw.
+        """
+        width = self._width_cache.get(text)
+        if width is None:
+            if len(self._width_cache) >= 64:
+                self._width_cache.clear()
+            width = self._width_fn(text)
+            self._width_cache[text] = width
+        return width
+
+    @staticmethod
+    def _get_display_name(name):
+        """
+        Convert the name of the content into the title shown in the header,
+        e.g. /r/front -> Front Page
+        """
+        sub_name = name.replace('/r/front', 'Front Page')
+
+        parts = sub_name.split('/')
+        if len(parts) == 1:
+            pass
+        elif '/m/' in sub_name:
+            _, _, user, _, multi = parts
+            sub_name = '{} Curated by {}'.format(multi, user)
+        elif parts[1] == 'u':
+            noun = 'My' if parts[2] == 'me' else parts[2] + "'s"
+            user_room = parts[3] if len(parts) == 4 else 'overview'
+            sub_name = "{} {}".format(noun, _USER_ROOM_TITLES[user_room])
+
+        return sub_name
+
+    def _draw_banner(self, n_rows, n_cols):
         """
         Draw the banner with sorting options at the top of the page
         """
-        n_rows, n_cols = self.term.stdscr.getmaxyx()
-        window = self.term.stdscr.derwin(1, n_cols, self._row, 0)
+        window = self._get_window('banner', 1, n_rows, n_cols)
+        window.bkgdset(str(' '), self._attrs['OrderBar'])
         window.erase()
-        window.bkgd(str(' '), self.term.attr('OrderBar'))
 
         banner = docs.BANNER_SEARCH if self.content.query else self.BANNER
-        items = banner.strip().split(' ')
+        order = self.content.order
+        if order is not None:
+            order = order.partition('-')[0]
+
+        # The banner text and the position of the highlighted order only
+        # depend on the width of the terminal
+        key = (banner, n_cols, order)
+        if key not in self._banner_cache:
+            if banner not in self._banner_items:
+                items = banner.strip().split(' ')
+                self._banner_items[banner] = (items, sum(len(t) for t in items))
+            items, items_len = self._banner_items[banner]
+            distance = (n_cols - items_len - 1) // (len(items) - 1)
+            spacing = max(1, distance) * ' '
+            text = spacing.join(items)
+            # Anchor on the closing bracket so that the order can't match
+            # part of a different item, e.g. "new" inside of "[4]renew"
+            col = None if order is None else text.find(']' + order) - 2
+            self._banner_cache[key] = (text, col)
+        text, col = self._banner_cache[key]
 
-        distance = (n_cols - sum(len(t) for t in items) - 1) / (len(items) - 1)
-        spacing = max(1, int(distance)) * ' '
-        text = spacing.join(items)
         self.term.add_line(window, text, 0, 0)
-        if self.content.order is not None:
-            order = self.content.order.split('-')[0]
-            col = text.find(order) - 3
-            attr = self.term.attr('OrderBarHighlight')
+        if col is not None:
+            attr = self._attrs['OrderBarHighlight']
             window.chgat(0, col, 3, attr)
 
         self._row += 1
 
-    def _draw_content(self):
+    def _draw_content(self, n_rows, n_cols):
         """
         Loop through submissions and fill up the content page.
         """
-        n_rows, n_cols = self.term.stdscr.getmaxyx()
-        window = self.term.stdscr.derwin(n_rows - self._row - 1, n_cols, self._row, 0)
+        # The content fills the space between the banner and the footer, so
+        # the size is already known without asking curses for it
+        win_n_rows, win_n_cols = n_rows - self._row - 1, n_cols
+        window = self._get_window('content', win_n_rows, n_rows, n_cols)
+        # The window is re-used between draws, so it doesn't pick up a new
+        # background from stdscr when the theme changes
+        window.bkgdset(str(' '), self._attrs['Normal'])
         window.erase()
-        win_n_rows, win_n_cols = window.getmaxyx()
+
+        layout, cancel_inverted = self._layout_content(win_n_rows, win_n_cols)
+        if cancel_inverted and self.nav.inverted:
+            # In some cases we need to make sure that the screen is NOT
+            # inverted. We can't pre-determine if the content will fill up the
+            # page because it depends on the size of the terminal. However,
+            # the layout doesn't touch curses so it's cheap to compute again.
+            self.nav.flip((len(layout) - 1))
+            layout, _ = self._layout_content(win_n_rows, win_n_cols)
+
+        # Subwindows with the same geometry as the last draw are re-used
+        # instead of allocating new ones, e.g. when voting or after a popup
+        if window is not self._subwindow_parent:
+            self._subwindow_cache = {}
+            self._subwindow_parent = window
+        cache, self._subwindow_cache = self._subwindow_cache, {}
 
         self._subwindows = []
+        for subwin_n_rows, subwin_n_cols, start, h_offset, data, subwin_inverted in layout:
+            key = (subwin_n_rows, subwin_n_cols, start, h_offset)
+            subwindow = cache.get(key)
+            if subwindow is None:
+                subwindow = window.derwin(subwin_n_rows, subwin_n_cols, start, h_offset)
+            else:
+                # Start from the same cursor position as a new window
+                subwindow.move(0, 0)
+            self._subwindow_cache[key] = subwindow
+            self._subwindows.append((subwindow, data, subwin_inverted))
+
+        if self.nav.cursor_index >= len(self._subwindows):
+            # Don't allow the cursor to go over the number of subwindows
+            # This could happen if the window is resized and the cursor index is
+            # pushed out of bounds
+            self.nav.cursor_index = len(self._subwindows) - 1
+
+        # Now that the windows are setup, we can take a second pass through
+        # to draw the text onto each subwindow
+        if self.nav.absolute_index >= 0:
+            selected_index = self.nav.cursor_index
+        else:
+            selected_index = None
+        selected_attr = self._attrs['Selected']
+        normal_attr = self._attrs['Normal']
+        draw_item = self._draw_item
+        for index, (win, data, inverted) in enumerate(self._subwindows):
+            if index == selected_index:
+                win.bkgd(str(' '), selected_attr)
+                with self.term.theme.turn_on_selected():
+                    draw_item(win, data, inverted)
+            else:
+                win.bkgd(str(' '), normal_attr)
+                draw_item(win, data, inverted)
+
+        self._row += win_n_rows
+
+    def _layout_content(self, win_n_rows, win_n_cols):
+        """
+        Calculate the geometry of the subwindows that will fit on the content
+        page, starting from the current navigator position.
+
+        Returns:
+            layout (list): Tuples of (n_rows, n_cols, start_row, start_col,
+                data, inverted) for each subwindow.
+            cancel_inverted (bool): True if the page isn't full and should
+                not be drawn inverted.
+        """
+        layout = []
         page_index, cursor_index, inverted = self.nav.position
         step = self.nav.step
 
@@ -791,6 +1047,7 @@ class Page(object):
         available_rows = win_n_rows
         top_item_height = None if inverted else self.nav.top_item_height
         for data in self.content.iterate(page_index, step, win_n_cols - 2):
+            h_offset = data['h_offset']
             subwin_n_rows = min(available_rows, data['n_rows'])
             subwin_inverted = inverted
             if top_item_height is not None:
@@ -800,10 +1057,10 @@ class Page(object):
                 subwin_n_rows = min(subwin_n_rows, top_item_height)
                 subwin_inverted = True
                 top_item_height = None
-            subwin_n_cols = win_n_cols - data['h_offset']
+            subwin_n_cols = win_n_cols - h_offset
             start = current_row - subwin_n_rows + 1 if inverted else current_row
-            subwindow = window.derwin(subwin_n_rows, subwin_n_cols, start, data['h_offset'])
-            self._subwindows.append((subwindow, data, subwin_inverted))
+            layout.append((subwin_n_rows, subwin_n_cols, start, h_offset,
+                           data, subwin_inverted))
             available_rows -= (subwin_n_rows + 1)  # Add one for the blank line
             current_row += step * (subwin_n_rows + 1)
             if available_rows <= 0:
@@ -811,59 +1068,48 @@ class Page(object):
                 cancel_inverted = False
                 break
 
-        if len(self._subwindows) == 1:
+        if len(layout) == 1:
             # Never draw inverted if only one subwindow. The top of the
             # subwindow should always be aligned with the top of the screen.
             cancel_inverted = True
 
-        if cancel_inverted and self.nav.inverted:
-            # In some cases we need to make sure that the screen is NOT
-            # inverted. Unfortunately, this currently means drawing the whole
-            # page over again. Could not think of a better way to pre-determine
-            # if the content will fill up the page, given that it is dependent
-            # on the size of the terminal.
-            self.nav.flip((len(self._subwindows) - 1))
-            self._draw_content()
-            return
-
-        if self.nav.cursor_index >= len(self._subwindows):
-            # Don't allow the cursor to go over the number of subwindows
-            # This could happen if the window is resized and the cursor index is
-            # pushed out of bounds
-            self.nav.cursor_index = len(self._subwindows) - 1
-
-        # Now that the windows are setup, we can take a second pass through
-        # to draw the text onto each subwindow
-        for index, (win, data, inverted) in enumerate(self._subwindows):
-            if self.nav.absolute_index >= 0 and index == self.nav.cursor_index:
-                win.bkgd(str(' '), self.term.attr('Selected'))
-                with self.term.theme.turn_on_selected():
-                    self._draw_item(win, data, inverted)
-            else:
-                win.bkgd(str(' '), self.term.attr('Normal'))
-                self._draw_item(win, data, inverted)
-
-        self._row += win_n_rows
+        return layout, cancel_inverted
 
-    def _draw_footer(self):
+    def _draw_footer(self, n_rows, n_cols):
         """
         Draw the key binds help bar at the bottom of the screen
         """
-        n_rows, n_cols = self.term.stdscr.getmaxyx()
-        window = self.term.stdscr.derwin(1, n_cols, self._row, 0)
+        sig = (self.FOOTER, n_rows, n_cols, self._row, self._attrs_theme)
+        if sig == self._footer_sig:
+            self._row += 1
+            return
+        self._footer_sig = sig
+
+        window = self._get_window('footer', 1, n_rows, n_cols)
+        window.bkgdset(str(' '), self._attrs['HelpBar'])
         window.erase()
-        window.bkgd(str(' '), self.term.attr('HelpBar'))
 
         text = self.FOOTER.strip()
         self.term.add_line(window, text, 0, 0)
         self._row += 1
 
     def _move_cursor(self, direction):
-        # Note: ACS_VLINE doesn't like changing the attribute, so disregard the
-        # redraw flag and opt to always redraw
+        prev_index = self.nav.cursor_index
         valid, redraw = self.nav.move(direction, len(self._subwindows))
         if not valid:
             self.term.flash()
+            if self._cursor_moved is None:
+                self._cursor_moved = False
+        else:
+            if redraw:
+                self._cursor_prev = None
+            elif self._cursor_moved is None:
+                # The page didn't scroll, so only the previous and the new
+                # selection need to be drawn again. Note: ACS_VLINE doesn't
+                # like changing the attribute with chgat(), so the items are
+                # drawn from scratch instead of just being highlighted.
+                self._cursor_prev = prev_index
+            self._cursor_moved = True
 
     def _move_page(self, direction):
         valid, redraw = self.nav.move_page(direction, len(self._subwindows)-1)
@@ -871,16 +1117,8 @@ class Page(object):
             self.term.flash()
 
     def _prompt_period(self, order):
-        choices = {
-            '\n': order,
-            '1': '{0}-hour'.format(order),
-            '2': '{0}-day'.format(order),
-            '3': '{0}-week'.format(order),
-            '4': '{0}-month'.format(order),
-            '5': '{0}-year'.format(order),
-            '6': '{0}-all'.format(order)}
-
-        message = docs.TIME_ORDER_MENU.strip().splitlines()
-        ch = self.term.show_notification(message)
-        ch = six.unichr(ch)
-        return choices.get(ch)
+        ch = self.term.show_notification(_TIME_ORDER_LINES)
+        suffix = self._PERIOD_SUFFIXES.get(ch)
+        if suffix is None:
+            return None
+        return order + suffix
@@ -308,17 +308,19 @@ class SubmissionPage(Page):
                 self.term.add_space(win)
                 self.term.add_line(win, '[saved]', attr=attr)
 
+        attr = self.term.attr('CommentText')
         for row, text in enumerate(split_body, start=offset + 1):
-            attr = self.term.attr('CommentText')
             if row in valid_rows:
                 self.term.add_line(win, text, row, 1, attr=attr)
 
         # curses.vline() doesn't support custom colors so need to build the
-        # cursor bar on the left of the comment one character at a time
+        # cursor bar on the left of the comment one character at a time. The
+        # character and attribute are the same for every row.
         index = data['level'] % len(self.term.theme.CURSOR_BARS)
         attr = self.term.attr(self.term.theme.CURSOR_BARS[index])
+        vline = self.term.vline
         for y in range(n_rows):
-            self.term.addch(win, y, 0, self.term.vline, attr)
+            self.term.addch(win, y, 0, vline, attr)
 
     def _draw_more_comments(self, win, data):
 
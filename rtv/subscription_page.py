@@ -63,7 +63,7 @@ class SubscriptionPage(Page):
         """
         self.active = False
 
-    def _draw_banner(self):
+    def _draw_banner(self, n_rows, n_cols):
         # Subscriptions can't be sorted, so disable showing the order menu
         pass
 
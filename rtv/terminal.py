@@ -66,6 +66,8 @@ class Terminal(object):
         self.theme_list = ThemeList()
 
         self._display = None
+        self._clean_cache = {}
+        self.suspend_count = 0
         self._mailcap_dict = mailcap.getcaps()
         self._term = os.environ.get('TERM')
 
@@ -163,9 +165,8 @@ class Terminal(object):
         """
         return self.stdscr.getch()
 
-    @staticmethod
     @contextmanager
-    def suspend():
+    def suspend(self):
         """
         Suspend curses in order to open another subprocess in the terminal.
         """
@@ -174,6 +175,9 @@ class Terminal(object):
             curses.endwin()
             yield
         finally:
+            # The program may have changed the terminal title, so let the
+            # pages know that they need to set it again
+            self.suspend_count += 1
             curses.doupdate()
 
     @contextmanager
@@ -238,6 +242,21 @@ class Terminal(object):
         if n_cols is not None and n_cols <= 0:
             return ''
 
+        # The same titles, authors and comment lines are cleaned on every
+        # redraw, and chopping them to width is measured character by
+        # character, so remember the results. The type is part of the key
+        # because py2 considers equal unicode and byte strings the same key.
+        key = (string, type(string), n_cols, self.config['ascii'])
+        cleaned = self._clean_cache.get(key)
+        if cleaned is None:
+            if len(self._clean_cache) >= 1024:
+                self._clean_cache.clear()
+            cleaned = self._clean(string, n_cols)
+            self._clean_cache[key] = cleaned
+        return cleaned
+
+    def _clean(self, string, n_cols):
+
         if isinstance(string, six.text_type):
             string = unescape(string)
 
@@ -836,13 +855,16 @@ class Terminal(object):
         prompt_win = curses.newwin(1, len(prompt) + 1, s_row, s_col)
         prompt_win.bkgd(ch, attr)
         self.add_line(prompt_win, prompt)
-        prompt_win.refresh()
+        prompt_win.noutrefresh()
 
         # Create a separate window for text input
         s_col = h_offset + len(prompt)
         input_win = curses.newwin(1, n_cols - len(prompt), s_row, s_col)
         input_win.bkgd(ch, attr)
-        input_win.refresh()
+        # Push both windows to the screen at once. The input window goes
+        # last so that the cursor is left inside of it
+        input_win.noutrefresh()
+        curses.doupdate()
 
         if key:
             self.curs_set(1)
@@ -157,6 +157,7 @@ class Theme(object):
 
         self._color_pair_map = None
         self._attribute_map = None
+        self._selected_attribute_map = None
         self._selected = None
 
         self.required_color_pairs = 0
@@ -251,6 +252,13 @@ class Theme(object):
 
             self._attribute_map[element] = attrs
 
+        # Index the "@" variants by their plain name so that get() doesn't
+        # need to build the key for every selected element
+        self._selected_attribute_map = {}
+        for element, attrs in self._attribute_map.items():
+            if element.startswith('@'):
+                self._selected_attribute_map[element[1:]] = attrs
+
     def get(self, element, selected=False):
         """
         Returns the curses attribute code for the given element.
@@ -260,7 +268,7 @@ class Theme(object):
                                'calling initialize_curses_theme()')
 
         if selected or self._selected:
-            element = '@{0}'.format(element)
+            return self._selected_attribute_map[element]
 
         return self._attribute_map[element]
 
@@ -85,6 +85,21 @@ class MockStdscr(mock.MagicMock):
         self.subwin.y = 0
         return self.subwin
 
+    def newwin(self, nlines, ncols, begin_y=0, begin_x=0):
+        """
+        Mimic curses.newwin() by returning a separate window from the ones
+        created with derwin(), so that popups don't resize the page windows
+        """
+
+        if 'popup' not in dir(self):
+            self.attach_mock(MockStdscr(), 'popup')
+
+        self.popup.nlines = nlines
+        self.popup.ncols = ncols
+        self.popup.x = 0
+        self.popup.y = 0
+        return self.popup
+
 
 @pytest.fixture(scope='session')
 def vcr(request):
@@ -152,6 +167,7 @@ def stdscr():
             patch('curses.echo'),               \
             patch('curses.flash'),              \
             patch('curses.endwin'),             \
+            patch('curses.flushinp'),           \
             patch('curses.newwin'),             \
             patch('curses.noecho'),             \
             patch('curses.cbreak'),             \
@@ -165,7 +181,7 @@ def stdscr():
             patch('curses.use_default_colors'):
         out = MockStdscr(nlines=40, ncols=80, x=0, y=0)
         curses.initscr.return_value = out
-        curses.newwin.side_effect = lambda *args: out.derwin(*args)
+        curses.newwin.side_effect = out.newwin
         curses.color_pair.return_value = 23
         curses.has_colors.return_value = True
         curses.ACS_VLINE = 0
@@ -124,6 +124,31 @@ def test_content_wrap_text():
     assert Content.wrap_text('\n\n\n\n', 70) == ['', '', '', '']
 
 
+@mock.patch.dict(Content._wrap_cache, clear=True)
+def test_content_wrap_text_cached():
+
+    text = 'the quick brown fox\njumps over'
+    lines = Content.wrap_text(text, 10)
+
+    # The same text and width shouldn't need to be measured again
+    with mock.patch('rtv.content.wrap') as wrap:
+        assert Content.wrap_text(text, 10) == lines
+        assert not wrap.called
+
+        # A different width is wrapped separately
+        wrap.return_value = ['x']
+        assert Content.wrap_text(text, 20) == ['x', 'x']
+
+        # So is a byte string with the same contents
+        wrap.reset_mock()
+        Content.wrap_text(text.encode('utf-8'), 10)
+        assert wrap.called
+
+    # Callers modify the returned list, which shouldn't touch the cache
+    lines.append('extra')
+    assert Content.wrap_text(text, 10) != lines
+
+
 @pytest.mark.skip('Reddit API changed, need to update this test')
 def test_content_flatten_comments(reddit):
 
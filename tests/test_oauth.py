@@ -112,7 +112,7 @@ def test_oauth_authorize_without_autologin(oauth, terminal, refresh_token):
     oauth.authorize(autologin=False)
 
     text = 'Welcome civilization_phaze_3!'.encode('utf-8')
-    terminal.stdscr.subwin.addstr.assert_any_call(1, 1, text)
+    terminal.stdscr.popup.addstr.assert_any_call(1, 1, text)
 
 
 def test_oauth_clear_data(oauth):
@@ -167,7 +167,7 @@ def test_oauth_authorize(oauth, reddit, stdscr, refresh_token):
         uuid.return_value = 'invalidcode'
         oauth.authorize()
         error_message = 'UUID mismatch'.encode('utf-8')
-        stdscr.subwin.addstr.assert_any_call(1, 1, error_message)
+        stdscr.popup.addstr.assert_any_call(1, 1, error_message)
 
         # Valid authorization, terminal browser
         oauth.term._display = True
@@ -58,8 +58,8 @@ def test_objects_load_screen(terminal, stdscr, use_ascii):
     assert not terminal.loader._is_running
     assert not terminal.loader._animator.is_alive()
     assert terminal.loader.exception is None
-    assert stdscr.subwin.ncols == 10
-    assert stdscr.subwin.nlines == 3
+    assert stdscr.popup.ncols == 10
+    assert stdscr.popup.nlines == 3
 
 
 @pytest.mark.parametrize('use_ascii', [True, False])
@@ -87,7 +87,7 @@ def test_objects_load_screen_exception_handled(terminal, stdscr, use_ascii):
     assert not terminal.loader._animator.is_alive()
     assert isinstance(terminal.loader.exception, requests.ConnectionError)
     error_message = 'ConnectionError'.encode('ascii' if use_ascii else 'utf-8')
-    stdscr.subwin.addstr.assert_called_with(1, 1, error_message)
+    stdscr.popup.addstr.assert_called_with(1, 1, error_message)
 
 
 @pytest.mark.parametrize('use_ascii', [True, False])
@@ -186,7 +186,7 @@ def test_objects_load_screen_nested_complex(terminal, stdscr, use_ascii):
     assert not terminal.loader._is_running
     assert not terminal.loader._animator.is_alive()
     error_message = 'ConnectionError'.encode('ascii' if use_ascii else 'utf-8')
-    stdscr.subwin.addstr.assert_called_once_with(1, 1, error_message)
+    stdscr.popup.addstr.assert_called_once_with(1, 1, error_message)
 
 
 def test_objects_curses_session(stdscr):
@@ -197,6 +197,17 @@ def test_objects_curses_session(stdscr):
     assert curses.initscr.called
     assert curses.endwin.called
     assert curses.use_default_colors.called
+    stdscr.leaveok.assert_called_with(1)
+    curses.initscr.reset_mock()
+    curses.endwin.reset_mock()
+    stdscr.leaveok.reset_mock()
+
+    # If the cursor can't be hidden, curses should keep placing it
+    curses.curs_set.side_effect = curses.error
+    with curses_session():
+        pass
+    assert not stdscr.leaveok.called
+    curses.curs_set.side_effect = None
     curses.initscr.reset_mock()
     curses.endwin.reset_mock()
 
@@ -299,6 +310,33 @@ def test_objects_controller_double_press():
     assert controller_a.trigger('g') is None
 
 
+def test_objects_controller_double_press_parent():
+
+    class ControllerA(Controller):
+        character_map = {}
+
+    class ControllerB(ControllerA):
+        character_map = {}
+
+    @ControllerA.register(Command('F1'))
+    def call_page(_):
+        return 'a1'
+
+    @ControllerB.register('g')
+    def call_page(_):
+        return 'b1'
+
+    keymap = KeyMap({'F1': ['gg']})
+    controller_a = ControllerA(None, keymap=keymap)
+    controller_b = ControllerB(None, keymap=keymap)
+
+    # The child's single key takes precedence over the parent's double key
+    assert controller_a.trigger('g') is None
+    assert controller_a.trigger('g') == 'a1'
+    assert controller_b.trigger('g') == 'b1'
+    assert controller_b.trigger('g') == 'b1'
+
+
 def test_objects_controller_command():
 
     class ControllerA(Controller):
@@ -426,6 +464,13 @@ def test_objects_navigator_properties():
     assert nav.absolute_index == 3
     assert nav.top_item_height == 10
 
+    # The step should follow the orientation when it's changed
+    nav.flip(2)
+    assert nav.inverted is False
+    assert nav.step == 1
+    nav.inverted = True
+    assert nav.step == -1
+
 
 def test_objects_navigator_move():
 
@@ -591,6 +636,35 @@ def test_objects_navigator_move_page():
     assert redraw
 
 
+def test_objects_navigator_move_page_bottom():
+
+    calls = []
+
+    def valid_page_cb(index):
+        calls.append(index)
+        if index < 0 or index > 20:
+            raise IndexError()
+
+    nav = Navigator(valid_page_cb, page_index=10, cursor_index=0)
+
+    # Only part of a page is left, the page should stop on the last item
+    # without checking each of the items in between
+    valid, redraw = nav.move_page(1, 16)
+    assert nav.absolute_index == 20
+    assert valid
+    assert redraw
+    assert len(calls) <= 6
+
+    # Nothing is left to move to
+    del calls[:]
+    page_index = nav.page_index
+    valid, redraw = nav.move_page(1, 16)
+    assert nav.page_index == page_index
+    assert nav.absolute_index == 20
+    assert not valid
+    assert redraw
+
+
 def test_objects_navigator_flip():
 
     def valid_page_cb(index):
@@ -28,13 +28,13 @@ def test_page_logged_in(terminal):
         func(page)
     message = 'Not logged in'.encode('utf-8')
     with pytest.raises(AssertionError):
-        terminal.stdscr.subwin.addstr.assert_called_with(1, 1, message)
+        terminal.stdscr.popup.addstr.assert_called_with(1, 1, message)
 
     # Logged out skips the function and displays a message
     page.reddit.is_oauth_session.return_value = False
     func(page)
     message = 'Not logged in'.encode('utf-8')
-    terminal.stdscr.subwin.addstr.assert_called_with(1, 1, message)
+    terminal.stdscr.popup.addstr.assert_called_with(1, 1, message)
 
 
 def test_page_unauthenticated(reddit, terminal, config, oauth):
@@ -88,8 +88,17 @@ def test_page_unauthenticated(reddit, terminal, config, oauth):
         for ch in logged_in_methods:
             page.controller.trigger(ch)
             message = 'Not logged in'.encode('utf-8')
-            terminal.stdscr.subwin.addstr.assert_called_with(1, 1, message)
-            terminal.stdscr.subwin.addstr.reset_mock()
+            terminal.stdscr.popup.addstr.assert_called_with(1, 1, message)
+            terminal.stdscr.popup.addstr.reset_mock()
+
+
+def test_page_clear_input_queue(reddit, terminal, config, oauth):
+
+    page = Page(reddit, terminal, config, oauth)
+
+    # Throw away any keys that were held down
+    page.clear_input_queue()
+    assert curses.flushinp.called
 
 
 def test_page_authenticated(reddit, terminal, config, oauth, refresh_token):
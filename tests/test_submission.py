@@ -121,7 +121,7 @@ def test_submission_unauthenticated(submission_page, terminal):
     for ch in methods:
         submission_page.controller.trigger(ch)
         text = 'Not logged in'.encode('utf-8')
-        terminal.stdscr.subwin.addstr.assert_called_with(1, 1, text)
+        terminal.stdscr.popup.addstr.assert_called_with(1, 1, text)
 
 
 def test_submission_open(submission_page, terminal):
@@ -8,6 +8,7 @@ import six
 import pytest
 
 from rtv import __version__
+from rtv.theme import Theme
 from rtv.subreddit_page import SubredditPage
 from rtv.packages.praw.errors import NotFound, HTTPException
 from requests.exceptions import ReadTimeout
@@ -33,8 +34,12 @@ def test_subreddit_page_construct(reddit, terminal, config, oauth):
     with terminal.loader():
         page = SubredditPage(reddit, terminal, config, oauth, '/r/python')
     assert terminal.loader.exception is None
+    curses.doupdate.reset_mock()
     page.draw()
 
+    # The screen should be pushed to the terminal in a single update
+    assert curses.doupdate.call_count == 1
+
     # Title
     title = '/r/python'.encode('utf-8')
     window.addstr.assert_any_call(0, 0, title)
@@ -95,31 +100,47 @@ def test_subreddit_reload_page(subreddit_page, terminal, reddit):
     assert terminal.loader.exception is None
 
 
-def test_subreddit_title(subreddit_page, terminal, capsys):
-    subreddit_page.content.name = 'hello ❤'
+def test_subreddit_title(reddit, terminal, config, oauth, capsys):
 
     with mock.patch.dict('os.environ', {'DISPLAY': ':1'}):
-        terminal.config['ascii'] = True
-        subreddit_page.draw()
-        out, _ = capsys.readouterr()
-        assert isinstance(out, six.text_type)
-        assert out == '\x1b]2;hello ? - rtv {}\x07'.format(__version__)
+        page = SubredditPage(reddit, terminal, config, oauth, '/r/python')
+    page.content.name = 'hello ❤'
 
-        terminal.config['ascii'] = False
-        subreddit_page.draw()
-        out, _ = capsys.readouterr()
-        assert isinstance(out, six.text_type)
-        assert out == '\x1b]2;hello ❤ - rtv {}\x07'.format(__version__)
+    terminal.config['ascii'] = True
+    page.draw()
+    out, _ = capsys.readouterr()
+    assert isinstance(out, six.text_type)
+    assert out == '\x1b]2;hello ? - rtv {}\x07'.format(__version__)
+
+    terminal.config['ascii'] = False
+    page.draw()
+    out, _ = capsys.readouterr()
+    assert isinstance(out, six.text_type)
+    assert out == '\x1b]2;hello ❤ - rtv {}\x07'.format(__version__)
+
+    # The title is only written when it changes
+    page.draw()
+    out, _ = capsys.readouterr()
+    assert not out
+
+    # Unless an external program could have overwritten it
+    with terminal.suspend():
+        pass
+    page.draw()
+    out, _ = capsys.readouterr()
+    assert out == '\x1b]2;hello ❤ - rtv {}\x07'.format(__version__)
 
     with mock.patch.dict('os.environ', {'DISPLAY': ''}):
-        subreddit_page.draw()
-        out, _ = capsys.readouterr()
-        assert not out
+        page = SubredditPage(reddit, terminal, config, oauth, '/r/python')
+    page.draw()
+    out, _ = capsys.readouterr()
+    assert not out
 
     with mock.patch.dict('os.environ', {'INSIDE_EMACS': '25.3.1,term:0.96'}):
-        subreddit_page.draw()
-        out, _ = capsys.readouterr()
-        assert not out
+        page = SubredditPage(reddit, terminal, config, oauth, '/r/python')
+    page.draw()
+    out, _ = capsys.readouterr()
+    assert not out
 
 
 def test_subreddit_search(subreddit_page, terminal):
@@ -198,7 +219,7 @@ def test_subreddit_prompt_submission_invalid(subreddit_page, terminal):
         assert isinstance(terminal.loader.exception, NotFound)
 
 
-def test_subreddit_order(subreddit_page):
+def test_subreddit_order(subreddit_page, terminal):
 
     # /r/python doesn't always have rising submissions, so use a larger sub
     subreddit_page.refresh_content(name='all')
@@ -210,6 +231,13 @@ def test_subreddit_order(subreddit_page):
     assert subreddit_page.content.order == 'rising'
     subreddit_page.controller.trigger('4')
     assert subreddit_page.content.order == 'new'
+
+    # The selected order is highlighted in the banner
+    subreddit_page.draw()
+    menu = '[1]hot     [2]top     [3]rising     [4]new     [5]controversial     [6]gilded'
+    attr = terminal.attr('OrderBarHighlight')
+    terminal.stdscr.subwin.chgat.assert_called_with(0, menu.index('[4]'), 3, attr)
+
     subreddit_page.controller.trigger('6')
     assert subreddit_page.content.order == 'gilded'
 
@@ -356,7 +384,7 @@ def test_subreddit_unauthenticated(subreddit_page, terminal):
     for ch in methods:
         subreddit_page.controller.trigger(ch)
         text = 'Not logged in'.encode('utf-8')
-        terminal.stdscr.subwin.addstr.assert_called_with(1, 1, text)
+        terminal.stdscr.popup.addstr.assert_called_with(1, 1, text)
 
 
 def test_subreddit_post(subreddit_page, terminal, reddit, refresh_token):
@@ -369,7 +397,7 @@ def test_subreddit_post(subreddit_page, terminal, reddit, refresh_token):
     subreddit_page.refresh_content(name='front')
     subreddit_page.controller.trigger('c')
     text = "Can't post to /r/front".encode('utf-8')
-    terminal.stdscr.subwin.addstr.assert_called_with(1, 1, text)
+    terminal.stdscr.popup.addstr.assert_called_with(1, 1, text)
 
     # Post a submission with a title but with no body
     subreddit_page.refresh_content(name='python')
@@ -377,7 +405,7 @@ def test_subreddit_post(subreddit_page, terminal, reddit, refresh_token):
         terminal.open_editor.return_value.__enter__.return_value = 'title'
         subreddit_page.controller.trigger('c')
         text = 'Missing body'.encode('utf-8')
-        terminal.stdscr.subwin.addstr.assert_called_with(1, 1, text)
+        terminal.stdscr.popup.addstr.assert_called_with(1, 1, text)
 
     # Post a fake submission
     url = 'https://www.reddit.com/r/Python/comments/2xmo63/'
@@ -545,6 +573,129 @@ def test_subreddit_draw_header(subreddit_page, refresh_token, terminal):
     terminal.stdscr.subwin.addstr.assert_any_call(0, 0, text)
 
 
+def test_subreddit_draw_theme(subreddit_page, terminal):
+    window = terminal.stdscr.subwin
+
+    # The cached draw attributes should be updated when the theme changes
+    terminal.set_theme(Theme(use_color=False))
+    window.bkgdset.reset_mock()
+    subreddit_page.draw()
+    window.bkgdset.assert_any_call(' ', terminal.attr('TitleBar'))
+    window.bkgdset.assert_any_call(' ', terminal.attr('HelpBar'))
+
+
+def test_subreddit_draw_theme_content(subreddit_page, terminal):
+    window = terminal.stdscr.subwin
+
+    # The content window is re-used between draws, so the blank space between
+    # items needs to be filled with the new theme's background
+    subreddit_page.draw()
+    terminal.set_theme(Theme(use_color=False))
+    window.bkgdset.reset_mock()
+    subreddit_page.draw()
+    window.bkgdset.assert_any_call(' ', terminal.attr('Normal'))
+    calls = [c for c in window.method_calls if c[0] in ('bkgdset', 'erase')]
+    content = calls.index(mock.call.bkgdset(' ', terminal.attr('Normal')))
+    assert calls[content + 1] == mock.call.erase()
+
+
+def test_subreddit_draw_reuse_windows(subreddit_page, terminal):
+    stdscr = terminal.stdscr
+
+    # The header, banner, content, and footer windows should be re-used
+    # between draws, along with the subwindows for each item
+    subreddit_page.draw()
+    content = stdscr.subwin
+    with mock.patch.object(stdscr, 'derwin', wraps=stdscr.derwin) as derwin, \
+            mock.patch.object(content, 'derwin', wraps=content.derwin) as subwin:
+        subreddit_page.draw()
+        assert not derwin.called
+        assert not subwin.called
+
+    # Until the terminal is resized
+    stdscr.nlines -= 1
+    with mock.patch.object(stdscr, 'derwin', wraps=stdscr.derwin) as derwin:
+        subreddit_page.draw()
+        assert derwin.call_count == 4
+
+
+def test_subreddit_loop_skip_invalid_move(subreddit_page, terminal):
+
+    # Pressing up on the first submission flashes without redrawing, but
+    # moving down does need to redraw the selection
+    keys = [ord('k'), ord('k'), ord('j')]
+
+    def getch():
+        if not keys:
+            subreddit_page.active = False
+            return -1
+        return keys.pop(0)
+
+    with mock.patch.object(terminal.stdscr, 'getch', side_effect=getch), \
+            mock.patch.object(subreddit_page, 'draw') as draw, \
+            mock.patch.object(subreddit_page, '_draw_cursor') as draw_cursor:
+        subreddit_page.loop()
+    assert curses.flash.call_count == 2
+    assert draw.call_count == 1
+    draw_cursor.assert_called_once_with(0)
+
+
+def test_subreddit_draw_cursor(subreddit_page, terminal):
+
+    subreddit_page.draw()
+    windows = [win for win, _, _ in subreddit_page._subwindows]
+
+    # Moving the cursor without scrolling only redraws the two selections
+    with mock.patch.object(subreddit_page, '_draw_item') as draw_item, \
+            mock.patch.object(subreddit_page, 'draw') as draw:
+        subreddit_page._cursor_moved = None
+        subreddit_page.move_cursor_down()
+        subreddit_page._draw_cursor(subreddit_page._cursor_prev)
+    assert not draw.called
+    assert subreddit_page.nav.cursor_index == 1
+    assert draw_item.call_count == 2
+    assert draw_item.call_args_list[0][0][0] is windows[0]
+    assert draw_item.call_args_list[1][0][0] is windows[1]
+    windows[1].bkgd.assert_called_with(' ', terminal.attr('Selected'))
+
+    # The whole page is drawn again if the terminal has been resized
+    subreddit_page._windows_size = None
+    with mock.patch.object(subreddit_page, 'draw') as draw:
+        subreddit_page._draw_cursor(0)
+    assert draw.called
+
+
+def test_subreddit_draw_skip_unchanged(subreddit_page, terminal):
+
+    # Only the banner and content need to be repainted if nothing else has
+    # changed
+    subreddit_page.draw()
+    with mock.patch.object(subreddit_page, '_get_window',
+                           wraps=subreddit_page._get_window) as get_window:
+        subreddit_page.draw()
+        assert get_window.call_count == 2
+
+    # A nested page will draw over the header and the footer
+    nested_page = mock.Mock()
+    nested_page.name = 'submission'
+    nested_page.loop.return_value = None
+
+    def getch():
+        if subreddit_page.selected_page is None:
+            subreddit_page.selected_page = nested_page
+        return -1
+
+    with mock.patch.object(terminal.stdscr, 'getch', side_effect=getch), \
+            mock.patch.object(subreddit_page, 'draw') as draw:
+        draw.side_effect = lambda: setattr(
+            subreddit_page, 'active', draw.call_count < 2)
+        subreddit_page.loop()
+    with mock.patch.object(subreddit_page, '_get_window',
+                           wraps=subreddit_page._get_window) as get_window:
+        subreddit_page.draw()
+        assert get_window.call_count == 4
+
+
 def test_subreddit_frontpage_toggle(subreddit_page, terminal):
     with mock.patch.object(terminal, 'prompt_input'):
 
@@ -157,6 +157,25 @@ def test_terminal_clean_ncols(terminal):
     assert text.decode('utf-8') == 'ｈｅｌｌ'
 
 
+def test_terminal_clean_cached(terminal):
+
+    text = terminal.clean('ｈｅｌｌｏ', n_cols=9)
+
+    # Cleaning the same string again shouldn't need to measure it
+    with mock.patch('rtv.terminal.textual_width_chop') as chop:
+        assert terminal.clean('ｈｅｌｌｏ', n_cols=9) == text
+        assert not chop.called
+
+        # Different widths are cleaned separately
+        chop.return_value = 'ｈ'
+        assert terminal.clean('ｈｅｌｌｏ', n_cols=2).decode('utf-8') == 'ｈ'
+        assert chop.called
+
+    # The result depends on the ascii setting
+    terminal.config['ascii'] = True
+    assert terminal.clean('ｈｅｌｌｏ', n_cols=9) == b'?????'
+
+
 @pytest.mark.parametrize('use_ascii', [True, False])
 def test_terminal_clean_unescape_html(terminal, use_ascii):
 
@@ -195,25 +214,25 @@ def test_terminal_show_notification(terminal, stdscr, use_ascii):
     # Multi-line messages should be automatically split
     text = 'line 1\nline 2\nline3'
     terminal.show_notification(text)
-    assert stdscr.subwin.nlines == 5
-    assert stdscr.subwin.addstr.call_count == 3
+    assert stdscr.popup.nlines == 5
+    assert stdscr.popup.addstr.call_count == 3
     stdscr.reset_mock()
 
     # The text should be trimmed to fit 40x80
     text = HELP.strip().splitlines()
     terminal.show_notification(text)
-    assert stdscr.subwin.nlines == 40
-    assert stdscr.subwin.ncols <= 80
-    assert stdscr.subwin.addstr.call_count == 38
+    assert stdscr.popup.nlines == 40
+    assert stdscr.popup.ncols <= 80
+    assert stdscr.popup.addstr.call_count == 38
     stdscr.reset_mock()
 
     # The text should be trimmed to fit in 20x20
     stdscr.nlines, stdscr.ncols = 15, 20
     text = HELP.strip().splitlines()
     terminal.show_notification(text)
-    assert stdscr.subwin.nlines == 15
-    assert stdscr.subwin.ncols == 20
-    assert stdscr.subwin.addstr.call_count == 13
+    assert stdscr.popup.nlines == 15
+    assert stdscr.popup.ncols == 20
+    assert stdscr.popup.addstr.call_count == 13
 
 
 @pytest.mark.parametrize('use_ascii', [True, False])
@@ -241,12 +260,12 @@ def test_terminal_text_input(terminal, stdscr, use_ascii):
 def test_terminal_prompt_input(terminal, stdscr, use_ascii):
 
     terminal.config['ascii'] = use_ascii
-    window = stdscr.derwin()
+    window = stdscr.popup
 
     window.getch.side_effect = [ord('h'), ord('i'), terminal.RETURN]
     assert isinstance(terminal.prompt_input('hi'), six.text_type)
 
-    stdscr.subwin.addstr.assert_called_with(0, 0, 'hi'.encode('ascii'))
+    stdscr.popup.addstr.assert_called_with(0, 0, 'hi'.encode('ascii'))
     assert window.nlines == 1
     assert window.ncols == 78
 
@@ -267,22 +286,22 @@ def test_terminal_prompt_y_or_n(terminal, stdscr):
 
     # Press 'y'
     assert terminal.prompt_y_or_n('hi')
-    stdscr.subwin.addstr.assert_called_with(0, 0, text)
+    stdscr.popup.addstr.assert_called_with(0, 0, text)
     assert not curses.flash.called
 
     # Press 'N'
     assert not terminal.prompt_y_or_n('hi')
-    stdscr.subwin.addstr.assert_called_with(0, 0, text)
+    stdscr.popup.addstr.assert_called_with(0, 0, text)
     assert not curses.flash.called
 
     # Press Esc
     assert not terminal.prompt_y_or_n('hi')
-    stdscr.subwin.addstr.assert_called_with(0, 0, text)
+    stdscr.popup.addstr.assert_called_with(0, 0, text)
     assert not curses.flash.called
 
     # Press an invalid key
     assert not terminal.prompt_y_or_n('hi')
-    stdscr.subwin.addstr.assert_called_with(0, 0, text)
+    stdscr.popup.addstr.assert_called_with(0, 0, text)
     assert curses.flash.called
 
 
@@ -406,7 +425,7 @@ def test_terminal_open_link_subprocess(terminal):
         def reset_mock():
             six_input.reset_mock()
             os.system.reset_mock()
-            terminal.stdscr.subwin.addstr.reset_mock()
+            terminal.stdscr.popup.addstr.reset_mock()
             Popen.return_value.communicate.return_value = '', 'stderr message'
             Popen.return_value.poll.return_value = 0
             Popen.return_value.wait.return_value = 0
@@ -415,7 +434,7 @@ def test_terminal_open_link_subprocess(terminal):
             # Check if an error message was printed to the terminal
             status = 'Program exited with status'.encode('utf-8')
             return any(status in args[0][2] for args in
-                       terminal.stdscr.subwin.addstr.call_args_list)
+                       terminal.stdscr.popup.addstr.call_args_list)
 
         # Non-blocking success
         reset_mock()
@@ -549,7 +568,7 @@ def test_terminal_open_urlview(terminal, stdscr):
 
         Popen.return_value.poll.return_value = 1
         terminal.open_urlview(data)
-        assert stdscr.subwin.addstr.called
+        assert stdscr.popup.addstr.called
 
         # Raise an OS error
         Popen.side_effect = side_effect
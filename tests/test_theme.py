@@ -210,6 +210,12 @@ def test_theme_initialize_attributes(stdscr):
     for element in Theme.DEFAULT_ELEMENTS:
         assert isinstance(theme.get(element), int)
 
+    # Selected elements are looked up by their plain name
+    attr = theme.get('@Link')
+    assert theme.get('Link', selected=True) == attr
+    with theme.turn_on_selected():
+        assert theme.get('Link') == attr
+
     theme = Theme(use_color=False)
     theme.bind_curses()
 